@@ -1,11 +1,11 @@
 # Quick dependency installer
 import sys
 import subprocess
+import importlib.util
 
 def install_if_missing(package_name, import_name):
-    try:
-        __import__(import_name)
-    except ImportError:
+    # find_spec only locates the package, the heavy imports happen on first use
+    if importlib.util.find_spec(import_name) is None:
         print(f"Installing {package_name}...")
         subprocess.check_call([sys.executable, "-m", "pip", "install", package_name])
         print(f"✅ {package_name} installed!")
@@ -15,22 +15,73 @@ install_if_missing("google-api-python-client", "googleapiclient")
 install_if_missing("yt-dlp", "yt_dlp")
 
 import socket
+import selectors
 import struct
 import subprocess
 import threading
 import time
 import re
 import os
+import queue
+import shutil
+import types
 import webbrowser
+from urllib.parse import urlparse, parse_qs
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple, Dict
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
-import yt_dlp
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, filedialog
 import json
 from datetime import datetime
 
+try:
+    import orjson  # Optional, much faster JSON encoding/decoding
+except ImportError:
+    orjson = None
+
+# Search term cleanup patterns, compiled once since they run for every song
+_PAREN_RE = re.compile(r'\s*\([^)]*\)\s*')
+_SUFFIX_RE = re.compile(r'\s*-\s*(Live|Acoustic|Demo|Remix).*', re.IGNORECASE)
+_FEAT_RE = re.compile(r'\s+(?:feat\.|ft\.|featuring)\s+', re.IGNORECASE)
+# YouTube ISO 8601 durations like PT1H2M3S, PT2M17S, PT45S
+_DURATION_RE = re.compile(r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?')
+
+# RB3Enhanced packet header: 4-byte magic, then protocol version, type, payload size, platform
+_MAGIC_BYTES = b'RB3E'  # RB3E_EVENTS_MAGIC (0x52423345) in network byte order
+_HDR = struct.Struct('BBBB')
+
+_SENTINEL = object()  # Marks a cached value that has not been computed yet
+
+_SETTINGS_FILENAME = 'rb3_video_player_settings.json'  # Last-resort location, next to the script
+
+# Used when no settings file exists yet; copy before modifying
+_DEFAULT_SETTINGS = types.MappingProxyType({
+    'youtube_api_key': '',
+    'preferred_quality': '1080p',
+    'fullscreen': True,
+    'muted': True,
+    'always_on_top': False,
+    'force_best_quality': True,
+    'sync_video_to_song': True,
+    'auto_quit_on_menu': True,
+    'video_start_delay': 0.0,
+    'debug_events': True,
+    'database_path': ''
+})
+
+def _dumps(obj) -> bytes:
+    """Serialize settings to indented JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, indent=2, sort_keys=True).encode('utf-8')
+
+def _loads(buf: bytes):
+    """Parse JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(buf)
+    return json.loads(buf)
+
 class SongDatabase:
     """Handles loading and querying the JSON song database"""
     
@@ -178,29 +229,141 @@ class SongDatabase:
 class YouTubeSearcher:
     """Handles YouTube API searches with duration-aware ranking"""
     
-    def __init__(self, api_key: str, song_database=None, gui_callback=None):
+    MAX_CACHE = 256  # Most recent searches kept in memory
+    MAX_MISS_CACHE = 128  # Searches that found nothing, kept apart so they can't evict found videos
+    CACHE_TTL = 30 * 86400  # Search results rarely change, re-search after 30 days
+    MISS_CACHE_TTL = 86400  # Songs with no match are retried daily in case a video appears
+    CACHE_FLUSH_DELAY = 10.0  # Write the cache file at most every 10 seconds
+    _CACHE_WRITE_LOCK = threading.Lock()  # Class-wide, a restarted listener's old searcher may still flush
+    
+    def __init__(self, api_key: str, song_database=None, gui_callback=None, cache_path=None):
         self.api_key = api_key
         self.youtube = None
-        self.search_cache: Dict[str, str] = {}
+        self.search_cache: OrderedDict = OrderedDict()  # search key -> (video_id, timestamp)
+        self.miss_cache: OrderedDict = OrderedDict()  # search key -> (None, timestamp)
         self.song_database = song_database
         self.gui_callback = gui_callback
+        self.cache_path = cache_path or os.path.expanduser("~/.rb3_video_cache.json")
+        self._cache_lock = threading.Lock()
+        self._flush_timer = None
+        # Searches run on several worker threads and httplib2 connections aren't
+        # thread-safe, so each thread keeps its own for reuse across requests
+        self._http_local = threading.local()
+        
+        self.load_search_cache()
         
         try:
             if api_key and api_key != "YOUR_YOUTUBE_API_KEY_HERE":
+                # Imported here so the GUI can open before the API client loads
+                from googleapiclient.discovery import build
                 self.youtube = build('youtube', 'v3', developerKey=api_key)
         except Exception as e:
             raise Exception(f"Failed to initialize YouTube API: {e}")
     
+    def _http(self):
+        """The calling thread's persistent HTTP connection to the API"""
+        http = getattr(self._http_local, 'http', None)
+        if http is None:
+            from googleapiclient.http import build_http
+            http = self._http_local.http = build_http()
+        return http
+    
+    def load_search_cache(self):
+        """Load persisted search results, skipping expired entries"""
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            if self.gui_callback:
+                self.gui_callback(f"⚠️ Could not read search cache: {e}")
+            return
+        
+        try:
+            now = time.time()
+            fresh = [(key, (video_id, timestamp)) for key, (video_id, timestamp) in entries.items()
+                     if now - timestamp < self._cache_ttl(video_id)]
+        except (AttributeError, TypeError, ValueError) as e:
+            if self.gui_callback:
+                self.gui_callback(f"⚠️ Ignoring malformed search cache: {e}")
+            return
+        
+        # Oldest first so the LRU order matches when each search was made
+        fresh.sort(key=lambda item: item[1][1])
+        with self._cache_lock:
+            for key, entry in fresh:
+                cache, limit = self._cache_for(entry[0])
+                cache[key] = entry
+                if len(cache) > limit:
+                    cache.popitem(last=False)
+            loaded = len(self.search_cache) + len(self.miss_cache)
+        
+        if fresh and self.gui_callback:
+            self.gui_callback(f"💾 Loaded {loaded} cached searches")
+    
+    def _cache_ttl(self, video_id: Optional[str]) -> float:
+        """How long a cached search result stays valid"""
+        return self.CACHE_TTL if video_id else self.MISS_CACHE_TTL
+    
+    def _cache_for(self, video_id: Optional[str]) -> Tuple[OrderedDict, int]:
+        """The cache a search result belongs in and that cache's size limit"""
+        if video_id:
+            return self.search_cache, self.MAX_CACHE
+        return self.miss_cache, self.MAX_MISS_CACHE
+    
+    def _cache_result(self, search_key: str, video_id: Optional[str]):
+        """Remember a search result, including misses, and schedule a save"""
+        cache, limit = self._cache_for(video_id)
+        with self._cache_lock:
+            # A song can move between caches when a re-search finds a video or loses it
+            self.search_cache.pop(search_key, None)
+            self.miss_cache.pop(search_key, None)
+            cache[search_key] = (video_id, time.time())
+            if len(cache) > limit:
+                cache.popitem(last=False)
+        self._schedule_cache_flush()
+    
+    def _schedule_cache_flush(self):
+        """Write the cache to disk soon, coalescing bursts of new results"""
+        with self._cache_lock:
+            if self._flush_timer is not None:
+                return
+            self._flush_timer = threading.Timer(self.CACHE_FLUSH_DELAY, self.flush_search_cache)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+    
+    def flush_search_cache(self):
+        """Write the search cache to disk"""
+        with self._CACHE_WRITE_LOCK:
+            with self._cache_lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                snapshot = {**self.miss_cache, **self.search_cache}
+            
+            # Write a temp file and swap it in so a crash can't leave invalid JSON
+            tmp_path = self.cache_path + '.tmp'
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(snapshot, f)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.cache_path)
+            except OSError as e:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                if self.gui_callback:
+                    self.gui_callback(f"⚠️ Failed to save search cache: {e}")
+    
     def parse_youtube_duration(self, duration_str):
         """Parse YouTube duration from ISO 8601 format (PT2M17S) to seconds"""
-        import re
-        
         if not duration_str:
             return None
         
-        # Pattern to match PT1H2M3S, PT2M17S, PT45S, etc.
-        pattern = r'PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?'
-        match = re.match(pattern, duration_str)
+        match = _DURATION_RE.match(duration_str)
         
         if not match:
             return None
@@ -223,7 +386,7 @@ class YouTubeSearcher:
             response = self.youtube.videos().list(
                 part='contentDetails',
                 id=video_ids_str
-            ).execute()
+            ).execute(http=self._http())
             
             durations = {}
             for item in response.get('items', []):
@@ -270,11 +433,11 @@ class YouTubeSearcher:
     
     def clean_search_terms(self, artist: str, song: str) -> Tuple[str, str]:
         """Clean up artist and song names for better search results"""
-        clean_song = re.sub(r'\s*\([^)]*\)\s*', '', song)
-        clean_song = re.sub(r'\s*-\s*(Live|Acoustic|Demo|Remix).*', '', clean_song, flags=re.IGNORECASE)
+        clean_song = _PAREN_RE.sub('', song)
+        clean_song = _SUFFIX_RE.sub('', clean_song)
         clean_song = clean_song.strip()
         
-        clean_artist = re.split(r'\s+(?:feat\.|ft\.|featuring)\s+', artist, flags=re.IGNORECASE)[0]
+        clean_artist = _FEAT_RE.split(artist)[0]
         clean_artist = clean_artist.strip()
         
         return clean_artist, clean_song
@@ -285,11 +448,16 @@ class YouTubeSearcher:
             return None
             
         clean_artist, clean_song = self.clean_search_terms(artist, song)
-        search_key = f"{clean_artist.lower()} - {clean_song.lower()}"
+        artist_l = clean_artist.lower()
+        song_l = clean_song.lower()
+        search_key = f"{artist_l} - {song_l}"
         
-        # Check cache first
-        if search_key in self.search_cache:
-            return self.search_cache[search_key]
+        # Check cache first, a cached None means the last search found nothing
+        with self._cache_lock:
+            cached = self.search_cache.get(search_key) or self.miss_cache.get(search_key)
+            if cached and time.time() - cached[1] < self._cache_ttl(cached[0]):
+                self._cache_for(cached[0])[0].move_to_end(search_key)
+                return cached[0]
         
         # Get target duration from database if available
         target_duration = None
@@ -297,86 +465,89 @@ class YouTubeSearcher:
             target_duration = self.song_database.get_song_duration(None, artist, song)
         
         try:
-            search_queries = [
-                f"{clean_artist} {clean_song} official music video",
-                f"{clean_artist} {clean_song} music video", 
-                f"{clean_artist} {clean_song} official",
-                f"{clean_artist} {clean_song}"
-            ]
+            # One query covers what used to take four; ranking happens locally
+            search_params = {
+                'q': f"{clean_artist} {clean_song}",
+                'part': 'id,snippet',
+                'maxResults': 10,  # Get more results for duration filtering
+                'type': 'video',
+                'videoCategoryId': '10',  # Music
+                'order': 'relevance',
+            }
+            search_response = self.youtube.search().list(**search_params).execute(http=self._http())
+            
+            # Some official uploads aren't filed under Music, retry once without the filter
+            if not search_response['items']:
+                del search_params['videoCategoryId']
+                search_response = self.youtube.search().list(**search_params).execute(http=self._http())
+            
+            if not search_response['items']:
+                self._cache_result(search_key, None)
+                return None
+            
+            # Fetch all durations in one videos.list call, only needed with a target to compare to
+            video_durations = {}
+            if target_duration:
+                video_ids = [item['id']['videoId'] for item in search_response['items']]
+                video_durations = self.get_video_durations(video_ids)
             
             best_video_id = None
             best_score = -1
-            
-            for query in search_queries:
-                search_response = self.youtube.search().list(
-                    q=query,
-                    part='id,snippet',
-                    maxResults=10,  # Get more results for duration filtering
-                    type='video',
-                    videoCategoryId='10',
-                    order='relevance'
-                ).execute()
+            official_terms = ('official', 'records', 'music', artist_l)
+            
+            # Score each video
+            for item in search_response['items']:
+                video_id = item['id']['videoId']
+                video_title = item['snippet']['title'].lower()
+                video_channel = item['snippet']['channelTitle'].lower()
+                video_duration = video_durations.get(video_id)
                 
-                if not search_response['items']:
-                    continue
+                # Base score from title/channel matching
+                base_score = 0
                 
-                # Get video IDs and fetch their durations
-                video_ids = [item['id']['videoId'] for item in search_response['items']]
-                video_durations = self.get_video_durations(video_ids)
+                is_official = any(term in video_channel for term in official_terms)
+                has_song_in_title = song_l in video_title
+                has_artist_in_title = artist_l in video_title
                 
-                # Score each video
-                for item in search_response['items']:
-                    video_id = item['id']['videoId']
-                    video_title = item['snippet']['title'].lower()
-                    video_channel = item['snippet']['channelTitle'].lower()
-                    video_duration = video_durations.get(video_id)
-                    
-                    # Base score from title/channel matching (existing logic)
-                    base_score = 0
-                    
-                    is_official = any(term in video_channel for term in ['official', 'records', 'music', clean_artist.lower()])
-                    has_song_in_title = clean_song.lower() in video_title
-                    has_artist_in_title = clean_artist.lower() in video_title
-                    
-                    if has_song_in_title and has_artist_in_title:
-                        base_score += 30
-                    elif has_song_in_title or has_artist_in_title:
-                        base_score += 15
-                    
-                    if is_official:
-                        base_score += 20
-                    
-                    # Add duration score if we have target duration
-                    duration_score = 0
-                    if target_duration and video_duration:
-                        duration_score = self.score_video_by_duration(video_duration, target_duration)
-                        
-                        # Log duration comparison for debugging
-                        target_min = target_duration // 60
-                        target_sec = target_duration % 60
-                        video_min = video_duration // 60
-                        video_sec = video_duration % 60
-                        if self.gui_callback:
-                            self.gui_callback(f"🎵 Comparing: Target {target_min}:{target_sec:02d} vs Video {video_min}:{video_sec:02d} (Score: {duration_score})")
-                    
-                    # Combine scores (duration gets more weight)
-                    total_score = base_score + (duration_score * 2)
+                if has_song_in_title and has_artist_in_title:
+                    base_score += 30
+                elif has_song_in_title or has_artist_in_title:
+                    base_score += 15
+                
+                if is_official:
+                    base_score += 20
+                
+                # Prefer actual music videos, in the order the old query fallbacks did
+                if 'official music video' in video_title:
+                    base_score += 25
+                elif 'music video' in video_title:
+                    base_score += 15
+                elif 'official' in video_title:
+                    base_score += 5
+                
+                # Add duration score if we have target duration
+                duration_score = 0
+                if target_duration and video_duration:
+                    duration_score = self.score_video_by_duration(video_duration, target_duration)
                     
-                    if total_score > best_score:
-                        best_score = total_score
-                        best_video_id = video_id
+                    # Log duration comparison for debugging
+                    target_min = target_duration // 60
+                    target_sec = target_duration % 60
+                    video_min = video_duration // 60
+                    video_sec = video_duration % 60
+                    if self.gui_callback:
+                        self.gui_callback(f"🎵 Comparing: Target {target_min}:{target_sec:02d} vs Video {video_min}:{video_sec:02d} (Score: {duration_score})")
                 
-                # If we found a good match, use it
-                if best_video_id and best_score > 50:
-                    break
+                # Combine scores (duration gets more weight)
+                total_score = base_score + (duration_score * 2)
+                
+                if total_score > best_score:
+                    best_score = total_score
+                    best_video_id = video_id
             
-            # Fall back to first result if no good duration match found
-            if not best_video_id and search_response['items']:
-                best_video_id = search_response['items'][0]['id']['videoId']
+            self._cache_result(search_key, best_video_id)
             
             if best_video_id:
-                self.search_cache[search_key] = best_video_id
-                
                 # Log the selection
                 if target_duration and self.gui_callback:
                     target_min = target_duration // 60
@@ -393,35 +564,72 @@ class YouTubeSearcher:
 class VLCPlayer:
     """VLC video player with GUI integration"""
     
+    _VLC_PATH_CACHE = _SENTINEL  # Shared by all instances, VLC doesn't move while we run
+    MAX_PLAYED = 10  # How many recent videos are remembered to avoid repeats
+    
     def __init__(self, gui_callback=None, song_database=None):
         self.vlc_path = self.find_vlc()
         self.current_process = None
-        self.played_videos = set()
+        self.played_videos: OrderedDict = OrderedDict()  # Recently played video IDs, oldest first
         self.gui_callback = gui_callback
         self.song_database = song_database
+        
+        # With python-vlc installed one player is reused for every song instead of
+        # launching a new VLC process; the instance is rebuilt when its options change
+        self._vlc = self._load_libvlc() if self.vlc_path else None
+        self._instance = None
+        self._instance_args = None
+        self._player = None
+        # Songs start on the listener's workers while auto-quit stops them from the
+        # socket thread; a released libvlc player must never be called into
+        self._player_lock = threading.Lock()
     
-    def find_vlc(self) -> Optional[str]:
-        """Find VLC executable"""
+    def _load_libvlc(self):
+        """Import the optional python-vlc bindings, None if unavailable"""
+        try:
+            import vlc
+            return vlc
+        except Exception:
+            # Not installed, or installed without a loadable libvlc
+            return None
+    
+    @classmethod
+    def find_vlc(cls) -> Optional[str]:
+        """Find VLC executable, remembering the result for later calls"""
+        if cls._VLC_PATH_CACHE is not _SENTINEL:
+            return cls._VLC_PATH_CACHE
+        
         possible_paths = [
             r"C:\Program Files\VideoLAN\VLC\vlc.exe",
             r"C:\Program Files (x86)\VideoLAN\VLC\vlc.exe",
             os.path.expanduser(r"~\AppData\Local\Programs\VLC\vlc.exe"),
         ]
         
-        try:
-            subprocess.run(["vlc", "--version"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=3)
-            return "vlc"
-        except:
-            pass
+        # PATH lookup without spawning VLC
+        vlc_path = shutil.which("vlc")
         
-        for path in possible_paths:
-            if os.path.isfile(path):
-                return path
+        if not vlc_path:
+            for path in possible_paths:
+                if os.path.isfile(path):
+                    vlc_path = path
+                    break
         
-        return None
+        cls._VLC_PATH_CACHE = vlc_path
+        return vlc_path
+    
+    def was_played(self, video_id: str) -> bool:
+        """Check whether a video is among the recently played ones"""
+        return video_id in self.played_videos
     
     def stop_current_video(self):
         """Stop any currently playing video"""
+        with self._player_lock:
+            if self._player is not None and self._player.get_media() is not None:
+                self._player.stop()
+                self._player.set_media(None)
+                if self.gui_callback:
+                    self.gui_callback("VLC stopped")
+        
         if self.current_process and self.current_process.poll() is None:
             try:
                 self.current_process.terminate()
@@ -442,7 +650,7 @@ class VLCPlayer:
                 self.gui_callback("❌ VLC not available")
             return
         
-        if video_id in self.played_videos:
+        if self.was_played(video_id):
             if self.gui_callback:
                 self.gui_callback(f"⏭️ Already played: {artist} - {song}")
             return
@@ -450,45 +658,17 @@ class VLCPlayer:
         self.stop_current_video()
         
         try:
-            vlc_cmd = [
-                self.vlc_path,
-                video_url,
-                "--intf", "dummy",
-                "--no-video-title-show",
-                f"--meta-title={artist} - {song}"
-            ]
-            
-            # Add GUI-configured options
-            if settings.get('fullscreen', True):
-                vlc_cmd.append("--fullscreen")
-            
-            if settings.get('muted', True):
-                vlc_cmd.append("--volume=0")
-            
-            if settings.get('always_on_top', False):
-                vlc_cmd.append("--video-on-top")
-            
-            if settings.get('force_best_quality', True):
-                vlc_cmd.extend([
-                    "--avcodec-hw=any",
-                    "--network-caching=3000",
-                ])
-            
-            self.current_process = subprocess.Popen(
-                vlc_cmd,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
-            )
-            
-            time.sleep(2)
+            if self._vlc:
+                started = self._start_libvlc(video_url, artist, song, settings)
+            else:
+                started = self._start_process(video_url, artist, song, settings)
             
-            if self.current_process.poll() is not None:
-                vlc_cmd = [self.vlc_path, video_url]
-                self.current_process = subprocess.Popen(vlc_cmd)
+            if not started:
+                return
             
-            self.played_videos.add(video_id)
-            if len(self.played_videos) > 10:
-                self.played_videos.pop()
+            self.played_videos[video_id] = None
+            if len(self.played_videos) > self.MAX_PLAYED:
+                self.played_videos.popitem(last=False)
             
             # Show duration info if available
             if self.song_database and self.song_database.is_loaded():
@@ -506,35 +686,170 @@ class VLCPlayer:
         except Exception as e:
             if self.gui_callback:
                 self.gui_callback(f"❌ Error playing video: {e}")
+    
+    def _start_libvlc(self, video_url: str, artist: str, song: str, settings: dict) -> bool:
+        """Play through the persistent libvlc player, returns False if it failed to start"""
+        with self._player_lock:
+            instance_args = ["--no-video-title-show"]
+            
+            if settings.get('always_on_top', False):
+                instance_args.append("--video-on-top")
+            
+            if settings.get('force_best_quality', True):
+                instance_args.extend([
+                    "--avcodec-hw=any",
+                    "--network-caching=3000",
+                ])
+            
+            instance_args = tuple(instance_args)
+            if self._player is None or instance_args != self._instance_args:
+                if self._player is not None:
+                    self._player.release()
+                    self._instance.release()
+                self._instance = self._vlc.Instance(*instance_args)
+                self._player = self._instance.media_player_new()
+                self._instance_args = instance_args
+            
+            media = self._instance.media_new(video_url)
+            media.set_meta(self._vlc.Meta.Title, f"{artist} - {song}")
+            self._player.set_media(media)
+            self._player.set_fullscreen(settings.get('fullscreen', True))
+            
+            if self._player.play() == -1:
+                if self.gui_callback:
+                    self.gui_callback("❌ VLC could not start playback")
+                return False
+            
+            # The player outlives a song, so set the volume both ways or a mute would stick
+            self._player.audio_set_volume(0 if settings.get('muted', True) else 100)
+            
+            return True
+    
+    def close(self):
+        """Stop playback and release the libvlc player and instance"""
+        self.stop_current_video()
+        with self._player_lock:
+            if self._player is not None:
+                self._player.release()
+                self._instance.release()
+            self._player = None
+            self._instance = None
+            self._instance_args = None
+    
+    def _start_process(self, video_url: str, artist: str, song: str, settings: dict) -> bool:
+        """Play in a new VLC process, returns False if it exited right away"""
+        vlc_cmd = [
+            self.vlc_path,
+            video_url,
+            "--intf", "dummy",
+            "--no-video-title-show",
+            f"--meta-title={artist} - {song}"
+        ]
+        
+        # Add GUI-configured options
+        if settings.get('fullscreen', True):
+            vlc_cmd.append("--fullscreen")
+        
+        if settings.get('muted', True):
+            vlc_cmd.append("--volume=0")
+        
+        if settings.get('always_on_top', False):
+            vlc_cmd.append("--video-on-top")
+        
+        if settings.get('force_best_quality', True):
+            vlc_cmd.extend([
+                "--avcodec-hw=any",
+                "--network-caching=3000",
+            ])
+        
+        self.current_process = subprocess.Popen(
+            vlc_cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        
+        # Returns as soon as VLC exits; a timeout means it started fine
+        try:
+            return_code = self.current_process.wait(timeout=0.2)
+            self.current_process = None
+            if self.gui_callback:
+                self.gui_callback(f"❌ VLC exited immediately (rc={return_code})")
+            return False
+        except subprocess.TimeoutExpired:
+            return True
 
 class StreamExtractor:
     """Gets direct video URLs from YouTube"""
     
+    STREAM_CACHE_TTL = 4 * 3600  # Fallback lifetime when a URL doesn't carry its expiry
+    STREAM_EXPIRY_MARGIN = 1800  # Stop reusing a URL well before it expires so playback can finish
+    
     def __init__(self, gui_callback=None):
         self.gui_callback = gui_callback
+        self.stream_cache: Dict[str, Tuple[str, float]] = {}  # video_id -> (url, reuse until)
+        self._cache_lock = threading.Lock()
         self.ydl_opts = {
             'quiet': True,
             'no_warnings': True,
             'format': 'bestvideo+bestaudio/best',
             'noplaylist': True,
+            # Subtitles are never used, skip building the auto-translated caption tables
+            'extractor_args': {'youtube': {'skip': ['translated_subs']}},
         }
+        # yt-dlp registers hundreds of extractors on import, so load it only when
+        # needed and build a single instance that is reused for every lookup
+        import yt_dlp
+        self._ydl = yt_dlp.YoutubeDL(self.ydl_opts)
+        self._ydl_lock = threading.Lock()
+    
+    def _reuse_until(self, stream_url: str) -> float:
+        """When a stream URL should stop being reused, based on its signed expiry"""
+        try:
+            expire = int(parse_qs(urlparse(stream_url).query)['expire'][0])
+        except (KeyError, IndexError, ValueError):
+            return time.time() + self.STREAM_CACHE_TTL
+        return expire - self.STREAM_EXPIRY_MARGIN
+    
+    def close(self):
+        """Release the yt-dlp instance's connections"""
+        # Not under _ydl_lock: an extraction still running in a stopped listener's
+        # pool would hold it for seconds, and yt-dlp reopens what it needs lazily
+        self._ydl.close()
+    
+    def _cache_stream(self, video_id: str, stream_url: str):
+        """Remember a stream URL and drop any that have expired"""
+        now = time.time()
+        with self._cache_lock:
+            for key in [key for key, (_, until) in self.stream_cache.items() if until <= now]:
+                del self.stream_cache[key]
+            self.stream_cache[video_id] = (stream_url, self._reuse_until(stream_url))
     
     def get_stream_url(self, video_id: str) -> Optional[str]:
         """Get direct stream URL for a YouTube video"""
+        with self._cache_lock:
+            cached = self.stream_cache.get(video_id)
+        if cached and time.time() < cached[1]:
+            return cached[0]
+        
         try:
             youtube_url = f"https://www.youtube.com/watch?v={video_id}"
+            stream_url = None
             
-            with yt_dlp.YoutubeDL(self.ydl_opts) as ydl:
-                info = ydl.extract_info(youtube_url, download=False)
-                
-                if 'url' in info:
-                    return info['url']
-                elif 'formats' in info and info['formats']:
-                    for fmt in reversed(info['formats']):
-                        if fmt.get('url') and fmt.get('vcodec') != 'none':
-                            return fmt['url']
+            with self._ydl_lock:
+                info = self._ydl.extract_info(youtube_url, download=False)
             
-            return None
+            if 'url' in info:
+                stream_url = info['url']
+            elif 'formats' in info and info['formats']:
+                for fmt in reversed(info['formats']):
+                    if fmt.get('url') and fmt.get('vcodec') != 'none':
+                        stream_url = fmt['url']
+                        break
+            
+            if stream_url:
+                self._cache_stream(video_id, stream_url)
+            
+            return stream_url
             
         except Exception as e:
             if self.gui_callback:
@@ -568,15 +883,30 @@ class RB3EventListener:
         self.ip_detected_callback = ip_detected_callback
         self.sock = None
         self.running = False
+        # stop() writes to this pair to wake the receive loop immediately
+        self._wakeup_r, self._wakeup_w = socket.socketpair()
         self.current_song = ""
         self.current_artist = ""
         self.current_shortname = ""  # Now we can get the exact shortname!
+        self._last_searched = None  # (artist, song) most recently sent for lookup
         self.game_state = 0
         self.pending_video = None
         self.settings = {}
+        # Settings read while handling packets, kept as attributes by update_settings
+        self.sync_video = True
+        self.auto_quit = True
+        self.start_delay = 0.0
         self.rb3_ip_address = None
         self.last_packet_time = None
         
+        # Searches and stream lookups run here so network I/O never blocks the socket
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="rb3-prepare")
+        self._pending_future = None  # Lookup for the current song, if one was submitted
+        self._prefetch_key = None  # (artist, song) being looked up ahead of the shortname
+        self._prefetch_future = None
+        # Guards game_state, pending_video and _last_searched between socket and workers
+        self._state_lock = threading.Lock()
+        
         # Event discovery
         self.unknown_events = {}  # Track truly unknown event types
         self.event_history = []   # Store recent events for pattern analysis
@@ -585,6 +915,9 @@ class RB3EventListener:
     def update_settings(self, settings: dict):
         """Update settings from GUI"""
         self.settings = settings.copy()
+        self.sync_video = settings.get('sync_video_to_song', True)
+        self.auto_quit = settings.get('auto_quit_on_menu', True)
+        self.start_delay = settings.get('video_start_delay', 0.0)
     
     def start_listening(self):
         """Start listening for RB3Enhanced events"""
@@ -592,50 +925,63 @@ class RB3EventListener:
             self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
             self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            self.sock.settimeout(5.0)
+            try:
+                # Room for a burst of events while the thread is busy; the OS may cap this
+                self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+            except OSError:
+                pass  # Keep the default buffer
+            self.sock.setblocking(False)
             self.sock.bind(("0.0.0.0", 21070))
             self.running = True
             
             if self.gui_callback:
                 self.gui_callback("🎧 Listening for RB3Enhanced events on port 21070")
             
-            no_data_count = 0
-            
-            while self.running:
-                try:
-                    data, addr = self.sock.recvfrom(1024)
-                    no_data_count = 0
-                    
-                    # Extract IP address from sender
-                    sender_ip = addr[0]
-                    self.last_packet_time = datetime.now()
-                    
-                    # Update detected IP if it's changed or first detection
-                    if self.rb3_ip_address != sender_ip:
-                        self.rb3_ip_address = sender_ip
-                        if self.gui_callback:
-                            self.gui_callback(f"🌐 RB3Enhanced detected at: {sender_ip}")
-                        
-                        # Notify GUI that IP was detected
-                        if self.ip_detected_callback:
-                            self.ip_detected_callback(sender_ip)
-                    
-                    self.process_packet(data)
-                    
-                except socket.timeout:
-                    no_data_count += 1
-                    if no_data_count % 12 == 0:  # Every minute
-                        if self.gui_callback:
-                            self.gui_callback(f"⏰ Still listening... ({no_data_count * 5}s)")
-                    continue
-                    
-                except socket.error as e:
-                    if self.running and self.gui_callback:
-                        self.gui_callback(f"❌ Socket error: {e}")
+            with selectors.DefaultSelector() as selector:
+                selector.register(self.sock, selectors.EVENT_READ)
+                selector.register(self._wakeup_r, selectors.EVENT_READ)
+                self._receive_loop(selector)
                         
         except Exception as e:
             if self.gui_callback:
                 self.gui_callback(f"❌ Failed to start listener: {e}")
+        finally:
+            self._wakeup_r.close()
+    
+    def _receive_loop(self, selector):
+        """Wait for packets without waking up while the socket is idle"""
+        while self.running:
+            try:
+                ready = [key.fileobj for key, _ in selector.select(timeout=60.0)]
+                if self._wakeup_r in ready:
+                    return
+                if self.sock not in ready:
+                    continue
+                
+                data, addr = self.sock.recvfrom(1024)
+                
+                # Extract IP address from sender
+                sender_ip = addr[0]
+                self.last_packet_time = datetime.now()
+                
+                # Update detected IP if it's changed or first detection
+                if self.rb3_ip_address != sender_ip:
+                    self.rb3_ip_address = sender_ip
+                    if self.gui_callback:
+                        self.gui_callback(f"🌐 RB3Enhanced detected at: {sender_ip}")
+                    
+                    # Notify GUI that IP was detected
+                    if self.ip_detected_callback:
+                        self.ip_detected_callback(sender_ip)
+                
+                self.process_packet(data)
+                
+            except BlockingIOError:
+                continue
+                
+            except socket.error as e:
+                if self.running and self.gui_callback:
+                    self.gui_callback(f"❌ Socket error: {e}")
     
     def get_rb3_ip(self) -> Optional[str]:
         """Get the detected RB3Enhanced IP address"""
@@ -652,24 +998,27 @@ class RB3EventListener:
     
     def process_packet(self, data: bytes):
         """Process incoming RB3Enhanced packet with complete event support"""
-        if len(data) < 8:
+        # Cheap rejection of foreign traffic before any parsing
+        if len(data) < 8 or not data.startswith(_MAGIC_BYTES):
             return
         
         try:
-            magic = struct.unpack('>I', data[:4])[0]
-            version, packet_type, packet_size, platform = struct.unpack('BBBB', data[4:8])
+            version, packet_type, packet_size, platform = _HDR.unpack_from(data, 4)
             
-            if magic != self.RB3E_EVENTS_MAGIC or version != self.RB3E_EVENTS_PROTOCOL:
+            if version != self.RB3E_EVENTS_PROTOCOL:
                 return
             
             # Extract packet data
-            if packet_size > 0:
+            if packet_type == self.RB3E_EVENT_STATE:
+                # State is a single raw byte, no need to decode it
+                packet_data = data[8] if packet_size > 0 and len(data) > 8 else 0
+            elif packet_size > 0:
                 packet_data = data[8:8+packet_size].rstrip(b'\x00').decode('utf-8', errors='ignore')
             else:
                 packet_data = ""
             
-            # Log all events for discovery
-            timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+            # Log all events for discovery, formatted only when the summary is shown
+            timestamp = datetime.now()
             event_info = {
                 'timestamp': timestamp,
                 'type': packet_type,
@@ -755,39 +1104,74 @@ class RB3EventListener:
                 if self.debug_events and self.gui_callback:
                     self.gui_callback(f"❓ Unknown event {packet_type}: '{packet_data}' (size: {packet_size})")
             
+            # Artist and song are all the lookup needs, so start it now and let
+            # prepare_video pick up the cached result once the shortname arrives
+            if self.current_artist and self.current_song:
+                song_key = (self.current_artist, self.current_song)
+                if song_key != self._prefetch_key:
+                    self._prefetch_key = song_key
+                    self._prefetch_future = self._pool.submit(self._prefetch_video, *song_key)
+            
             # Process song info when we have what we need
             # Now we prefer shortname + (artist/song) for better matching
             if self.current_shortname and (self.current_song or self.current_artist):
-                if self.settings.get('sync_video_to_song', True):
-                    self.prepare_video()
-                else:
-                    self.play_current_song()
+                song_key = (self.current_artist, self.current_song)
+                song_info = (self.current_artist, self.current_song, self.current_shortname)
+                
+                # Reset for next song
+                self.current_song = ""
+                self.current_artist = ""
+                self.current_shortname = ""
+                
+                # Rebroadcasts of the same song shouldn't cost another search
+                with self._state_lock:
+                    is_new_song = song_key != self._last_searched
+                    self._last_searched = song_key
+                
+                if is_new_song:
+                    if self.sync_video:
+                        self._pending_future = self._pool.submit(self.prepare_video, *song_info)
+                    else:
+                        self._pending_future = self._pool.submit(self.play_current_song, *song_info)
         
         except Exception as e:
             if self.gui_callback:
                 self.gui_callback(f"❌ Error processing packet: {e}")
     
-    def handle_state_change(self, packet_data):
+    def handle_state_change(self, new_state: int):
         """Handle game state changes"""
         try:
-            new_state = int(packet_data) if packet_data.isdigit() else ord(packet_data[0]) if packet_data else 0
-            
             if self.game_state == 0 and new_state == 1:
                 if self.gui_callback:
                     self.gui_callback("🎵 Song starting!")
                 
-                if self.pending_video and self.settings.get('sync_video_to_song', True):
-                    self.start_pending_video()
+                with self._state_lock:
+                    self.game_state = new_state
+                    start_now = self.pending_video is not None and self.sync_video
+                
+                # Start on a worker so the start delay doesn't hold up the socket.
+                # A lookup still running starts the video itself when it finishes.
+                if start_now:
+                    self._pool.submit(self.start_pending_video)
+                elif self._pending_future and not self._pending_future.done():
+                    if self.gui_callback:
+                        self.gui_callback("⏳ Video still loading, it will start when ready")
             
             elif self.game_state == 1 and new_state == 0:
                 if self.gui_callback:
                     self.gui_callback("📋 Returned to menus")
                 
-                if self.settings.get('auto_quit_on_menu', True):
+                if self.auto_quit:
                     self.vlc_player.stop_current_video()
                 
                 # Clear all song-related data when returning to menu
-                self.pending_video = None
+                if self._pending_future:
+                    self._pending_future.cancel()
+                    self._pending_future = None
+                with self._state_lock:
+                    self.pending_video = None
+                    self._last_searched = None
+                self._prefetch_key = None
                 self.current_song = ""
                 self.current_artist = ""
                 self.current_shortname = ""
@@ -797,36 +1181,71 @@ class RB3EventListener:
         except Exception as e:
             pass
     
-    def prepare_video(self):
+    def _prefetch_video(self, artist: str, song: str):
+        """Warm the search and stream caches before the shortname arrives"""
+        try:
+            video_id = self.youtube_searcher.search_video(artist, song)
+            if video_id and not self.vlc_player.was_played(video_id):
+                self.stream_extractor.get_stream_url(video_id)
+        except Exception:
+            pass  # prepare_video retries and reports the error
+    
+    def _await_prefetch(self, artist: str, song: str):
+        """Wait for a prefetch of this song so its lookups aren't repeated"""
+        prefetch = self._prefetch_future
+        if prefetch and self._prefetch_key == (artist, song):
+            # Submitted before us, so it is already running and can't deadlock the pool
+            prefetch.result()
+    
+    def _resolve(self, artist: str, song: str) -> Optional[Tuple[str, str]]:
+        """Find the video and its stream URL for a song, reporting why when it can't.
+        Returns (stream_url, video_id) or None."""
+        self._await_prefetch(artist, song)
+        
+        # Use shortname for YouTube search context (but still search by artist+song)
+        video_id = self.youtube_searcher.search_video(artist, song)
+        if not video_id:
+            if self.gui_callback:
+                self.gui_callback(f"❌ Could not find video for: {artist} - {song}")
+            return None
+        
+        if self.vlc_player.was_played(video_id):
+            # VLCPlayer would refuse it anyway, don't spend an extraction on it
+            if self.gui_callback:
+                self.gui_callback(f"⏭️ Already played: {artist} - {song}")
+            return None
+        
+        if self.gui_callback:
+            self.gui_callback("🔄 Getting video stream...")
+        stream_url = self.stream_extractor.get_stream_url(video_id)
+        if not stream_url:
+            if self.gui_callback:
+                self.gui_callback(f"❌ Could not get stream for: {artist} - {song}")
+            return None
+        
+        return stream_url, video_id
+    
+    def prepare_video(self, artist: str, song: str, shortname: str):
         """Search for and prepare video using shortname when available"""
         try:
-            # Use shortname for YouTube search context (but still search by artist+song)
-            video_id = self.youtube_searcher.search_video(self.current_artist, self.current_song)
+            resolved = self._resolve(artist, song)
+            if not resolved:
+                return
+            stream_url, video_id = resolved
             
-            if video_id:
-                if self.gui_callback:
-                    self.gui_callback("🔄 Getting video stream...")
-                stream_url = self.stream_extractor.get_stream_url(video_id)
-                
-                if stream_url:
-                    # Store shortname with video info for better JSON lookup
-                    self.pending_video = (stream_url, video_id, self.current_artist, self.current_song, self.current_shortname)
-                    if self.gui_callback:
-                        self.gui_callback("✅ Video ready - waiting for song to start...")
-                    
-                    if self.game_state == 1:
-                        self.start_pending_video()
-                else:
-                    if self.gui_callback:
-                        self.gui_callback(f"❌ Could not get stream for: {self.current_artist} - {self.current_song}")
-            else:
-                if self.gui_callback:
-                    self.gui_callback(f"❌ Could not find video for: {self.current_artist} - {self.current_song}")
+            with self._state_lock:
+                # Drop the result if another song was picked or we went back to menus
+                if self._last_searched != (artist, song):
+                    return
+                # Store shortname with video info for better JSON lookup
+                self.pending_video = (stream_url, video_id, artist, song, shortname)
+                start_now = self.game_state == 1
+            
+            if self.gui_callback:
+                self.gui_callback("✅ Video ready - waiting for song to start...")
             
-            # Reset for next song
-            self.current_song = ""
-            self.current_artist = ""
-            self.current_shortname = ""
+            if start_now:
+                self.start_pending_video()
             
         except Exception as e:
             if self.gui_callback:
@@ -834,46 +1253,54 @@ class RB3EventListener:
     
     def start_pending_video(self):
         """Start the pending video with timing"""
-        if not self.pending_video:
+        # Take the video so the song-start event and a finishing lookup can't both play it
+        with self._state_lock:
+            pending = self.pending_video
+            self.pending_video = None
+        
+        if not pending:
             return
         
-        stream_url, video_id, artist, song, shortname = self.pending_video
+        stream_url, video_id, artist, song, shortname = pending
         
-        delay = self.settings.get('video_start_delay', 0.0)
+        delay = self.start_delay
         if delay != 0:
             if delay > 0:
                 if self.gui_callback:
                     self.gui_callback(f"⏰ Waiting {delay}s before starting video...")
                 time.sleep(delay)
+                
+                with self._state_lock:
+                    # Back in the menus or onto another song while we waited
+                    if self.game_state != 1 or self._last_searched != (artist, song):
+                        return
         
         # Now we can pass the actual shortname for perfect JSON database lookup!
         self.vlc_player.play_video(
             stream_url, video_id, artist, song, self.settings, shortname
         )
-        self.pending_video = None
     
-    def play_current_song(self):
+    def play_current_song(self, artist: str, song: str, shortname: str):
         """Play current song immediately using shortname when available"""
         try:
-            video_id = self.youtube_searcher.search_video(self.current_artist, self.current_song)
-            
-            if video_id:
-                stream_url = self.stream_extractor.get_stream_url(video_id)
-                if stream_url:
-                    # Pass the actual shortname for perfect JSON database lookup!
-                    self.vlc_player.play_video(
-                        stream_url, video_id, self.current_artist, self.current_song, 
-                        self.settings, self.current_shortname
-                    )
-            
-            self.current_song = ""
-            self.current_artist = ""
-            self.current_shortname = ""
+            resolved = self._resolve(artist, song)
+            if resolved:
+                stream_url, video_id = resolved
+                # Pass the actual shortname for perfect JSON database lookup!
+                self.vlc_player.play_video(
+                    stream_url, video_id, artist, song, 
+                    self.settings, shortname
+                )
             
         except Exception as e:
             if self.gui_callback:
                 self.gui_callback(f"❌ Error playing song: {e}")
     
+    @staticmethod
+    def _format_event_time(timestamp: datetime) -> str:
+        """Event time with milliseconds for the summary window"""
+        return timestamp.strftime("%H:%M:%S.%f")[:-3]
+    
     def get_event_summary(self):
         """Get summary of discovered events"""
         summary = {
@@ -891,15 +1318,18 @@ class RB3EventListener:
                 10: 'DX_DATA (mod data from RB3DX/other mods)'
             },
             'unknown_events': {},
-            'recent_history': self.event_history[-10:]  # Last 10 events
+            'recent_history': [  # Last 10 events
+                dict(event, timestamp=self._format_event_time(event['timestamp']))
+                for event in self.event_history[-10:]
+            ]
         }
         
         for event_type, occurrences in self.unknown_events.items():
             summary['unknown_events'][event_type] = {
                 'count': len(occurrences),
                 'sample_data': [occ['data'] for occ in occurrences[-3:]],  # Last 3 samples
-                'first_seen': occurrences[0]['timestamp'] if occurrences else None,
-                'last_seen': occurrences[-1]['timestamp'] if occurrences else None
+                'first_seen': self._format_event_time(occurrences[0]['timestamp']) if occurrences else None,
+                'last_seen': self._format_event_time(occurrences[-1]['timestamp']) if occurrences else None
             }
         
         return summary
@@ -907,6 +1337,14 @@ class RB3EventListener:
     def stop(self):
         """Stop listening"""
         self.running = False
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        
+        try:
+            self._wakeup_w.send(b'\0')
+        except OSError:
+            pass  # Receive loop already gone
+        self._wakeup_w.close()
+        
         if self.sock:
             self.sock.close()
 
@@ -927,6 +1365,16 @@ class RB3VideoPlayerGUI:
         self.listener_thread = None
         self.is_running = False
         self.detected_ip = None
+        self.listener_started = None
+        self._heartbeat_id = None
+        self._log_q = queue.Queue(maxsize=2000)  # Formatted log lines waiting for the GUI thread
+        self._log_line_count = 0  # Lines in the log display, tracked to avoid querying Tk
+        self._persisted_blob = None  # Serialized settings as last read from or written to disk
+        self._settings_lock = threading.Lock()  # Settings are written from the GUI and I/O threads
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rb3-io")
+        self._settings_path = None  # Resolved once by get_settings_path
+        self._pending_update = None  # Latest settings waiting to be pushed to the listener
+        self._update_scheduled = False
         
         # Add song database
         self.song_database = SongDatabase(gui_callback=self.log_message)
@@ -935,6 +1383,22 @@ class RB3VideoPlayerGUI:
         self.settings = self.load_settings()
         
         self.create_widgets()
+        
+        # Settings keys and the Tk variables that hold them, in save order
+        self._settings_spec = (
+            ('youtube_api_key', self.api_key_var),
+            ('preferred_quality', self.quality_var),
+            ('fullscreen', self.fullscreen_var),
+            ('muted', self.muted_var),
+            ('always_on_top', self.always_on_top_var),
+            ('force_best_quality', self.force_quality_var),
+            ('sync_video_to_song', self.sync_var),
+            ('auto_quit_on_menu', self.auto_quit_var),
+            ('video_start_delay', self.delay_var),
+            ('debug_events', self.debug_events_var),
+        )
+        
+        self.root.after(50, self._drain_log)
         self.update_ui_state()
         
         # Auto-load database if path is saved
@@ -944,7 +1408,13 @@ class RB3VideoPlayerGUI:
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
     
     def get_settings_path(self):
-        """Get the proper path for settings file"""
+        """Get the proper path for settings file, resolved on first use"""
+        if self._settings_path is None:
+            self._settings_path = self._find_settings_path()
+        return self._settings_path
+    
+    def _find_settings_path(self):
+        """Pick the settings file location, creating its directory if needed"""
         try:
             # Try AppData first (recommended)
             appdata_dir = os.environ.get('APPDATA')
@@ -966,7 +1436,7 @@ class RB3VideoPlayerGUI:
             pass
         
         # Last resort - script directory (current behavior)
-        return 'rb3_video_player_settings.json'
+        return _SETTINGS_FILENAME
     
     def create_widgets(self):
         """Create all GUI widgets"""
@@ -1401,8 +1871,7 @@ class RB3VideoPlayerGUI:
                 # Auto-save settings with new database path
                 try:
                     settings_path = self.get_settings_path()
-                    with open(settings_path, 'w') as f:
-                        json.dump(self.get_current_settings(), f, indent=2)
+                    self.write_settings(self.get_current_settings(), settings_path)
                     self.log_message(f"💾 Database path saved to settings")
                 except Exception as e:
                     self.log_message(f"⚠️ Failed to auto-save database path: {e}")
@@ -1449,8 +1918,7 @@ class RB3VideoPlayerGUI:
         # Auto-save settings to clear database path
         try:
             settings_path = self.get_settings_path()
-            with open(settings_path, 'w') as f:
-                json.dump(self.get_current_settings(), f, indent=2)
+            self.write_settings(self.get_current_settings(), settings_path)
             self.log_message(f"💾 Database path cleared from settings")
         except Exception as e:
             self.log_message(f"⚠️ Failed to auto-save cleared database path: {e}")
@@ -1486,22 +1954,47 @@ class RB3VideoPlayerGUI:
         timestamp = datetime.now().strftime("%H:%M:%S")
         formatted_message = f"[{timestamp}] {message}\n"
         
-        # Update in main thread
-        self.root.after(0, self._update_log, formatted_message)
+        # Picked up by the main thread in _drain_log. Never block the caller:
+        # when the GUI falls behind, the oldest pending line is dropped.
+        try:
+            self._log_q.put_nowait(formatted_message)
+        except queue.Full:
+            try:
+                self._log_q.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._log_q.put_nowait(formatted_message)
+            except queue.Full:
+                pass
     
-    def _update_log(self, message):
-        """Update log in main thread"""
-        self.log_text.insert('end', message)
-        self.log_text.see('end')
+    def _drain_log(self):
+        """Write all queued log messages in one batch from the main thread"""
+        messages = []
+        try:
+            while True:
+                messages.append(self._log_q.get_nowait())
+        except queue.Empty:
+            pass
         
-        # Keep log size reasonable
-        lines = int(self.log_text.index('end-1c').split('.')[0])
-        if lines > 1000:
-            self.log_text.delete('1.0', '100.0')
+        if messages:
+            text = ''.join(messages)
+            self.log_text.insert('end', text)
+            self.log_text.see('end')
+            
+            # Keep log size reasonable, trimming back to 900 lines in one delete
+            self._log_line_count += text.count('\n')
+            if self._log_line_count > 1000:
+                overflow = self._log_line_count - 900
+                self.log_text.delete('1.0', f'{overflow + 1}.0')
+                self._log_line_count = 900
+        
+        self.root.after(50, self._drain_log)
     
     def clear_log(self):
         """Clear the log display"""
         self.log_text.delete('1.0', 'end')
+        self._log_line_count = 0
         self.log_message("Log cleared")
     
     def update_ui_state(self):
@@ -1545,9 +2038,9 @@ class RB3VideoPlayerGUI:
     
     def check_vlc_status(self):
         """Check if VLC is available"""
-        vlc_player = VLCPlayer()
-        if vlc_player.vlc_path:
-            self.vlc_status_label.config(text=f"VLC: Available at {vlc_player.vlc_path}", 
+        vlc_path = VLCPlayer.find_vlc()
+        if vlc_path:
+            self.vlc_status_label.config(text=f"VLC: Available at {vlc_path}", 
                                        foreground='green')
         else:
             self.vlc_status_label.config(text="VLC: Not found - Please install VLC Media Player", 
@@ -1600,6 +2093,8 @@ class RB3VideoPlayerGUI:
             self.listener_thread.start()
             
             self.is_running = True
+            self.listener_started = datetime.now()
+            self._heartbeat_id = self.root.after(60000, self._listener_heartbeat)
             self.update_ui_state()
             self.log_message("Started listening for RB3Enhanced events!")
             
@@ -1607,13 +2102,38 @@ class RB3VideoPlayerGUI:
             messagebox.showerror("Error", f"Failed to start listener: {e}")
             self.log_message(f"❌ Failed to start: {e}")
     
+    def _listener_heartbeat(self):
+        """Log a reminder every minute while no events are arriving"""
+        self._heartbeat_id = None
+        if not self.is_running or not self.listener:
+            return
+        
+        last_activity = self.listener.last_packet_time or self.listener_started
+        idle_seconds = int((datetime.now() - last_activity).total_seconds())
+        if idle_seconds >= 60:
+            self.log_message(f"⏰ Still listening... ({idle_seconds}s)")
+        
+        self._heartbeat_id = self.root.after(60000, self._listener_heartbeat)
+    
     def stop_listener(self):
         """Stop the listener"""
+        if self._heartbeat_id:
+            self.root.after_cancel(self._heartbeat_id)
+            self._heartbeat_id = None
+        
         if self.listener:
             self.listener.stop()
         
         if self.vlc_player:
-            self.vlc_player.stop_current_video()
+            self.vlc_player.close()
+        
+        if self.youtube_searcher:
+            # Disk write, keep it off the Tk thread
+            self._io_pool.submit(self.youtube_searcher.flush_search_cache)
+        
+        if self.stream_extractor:
+            self.stream_extractor.close()
+            self.stream_extractor = None
         
         self.is_running = False
         self.update_ui_state()
@@ -1627,19 +2147,42 @@ class RB3VideoPlayerGUI:
     
     def get_current_settings(self):
         """Get current settings from GUI"""
-        return {
-            'youtube_api_key': self.api_key_var.get().strip(),
-            'preferred_quality': self.quality_var.get(),
-            'fullscreen': self.fullscreen_var.get(),
-            'muted': self.muted_var.get(),
-            'always_on_top': self.always_on_top_var.get(),
-            'force_best_quality': self.force_quality_var.get(),
-            'sync_video_to_song': self.sync_var.get(),
-            'auto_quit_on_menu': self.auto_quit_var.get(),
-            'video_start_delay': self.delay_var.get(),
-            'debug_events': self.debug_events_var.get(),
-            'database_path': self.settings.get('database_path', '')
-        }
+        settings = {key: var.get() for key, var in self._settings_spec}
+        settings['youtube_api_key'] = settings['youtube_api_key'].strip()
+        settings['database_path'] = self.settings.get('database_path', '')
+        return settings
+    
+    def write_settings(self, settings, settings_path) -> bool:
+        """Write settings to file unless they match what is already on disk.
+        Returns True if the file was written."""
+        data = _dumps(settings)
+        with self._settings_lock:
+            if data == self._persisted_blob:
+                return False
+            
+            # Write a temp file and swap it in so a crash can't leave a half-written file
+            # Raw descriptor: no Python file object in between
+            tmp_path = settings_path + '.tmp'
+            try:
+                fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+                try:
+                    view = memoryview(data)
+                    while view:
+                        # os.write may write less than it was given
+                        view = view[os.write(fd, view):]
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+                os.replace(tmp_path, settings_path)
+            except OSError:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+                raise
+            
+            self._persisted_blob = data
+            return True
     
     def save_settings(self):
         """Save settings to file"""
@@ -1649,45 +2192,73 @@ class RB3VideoPlayerGUI:
             
             settings_path = self.get_settings_path()
             
-            with open(settings_path, 'w') as f:
-                json.dump(settings, f, indent=2)
-            
-            # Update listener if running
+            # Update listener if running, once per idle cycle however often Save is hit
             if self.listener:
-                self.listener.update_settings(settings)
-            
-            messagebox.showinfo("Success", f"Settings saved successfully!\n\nLocation: {settings_path}")
-            self.log_message(f"Settings saved to: {settings_path}")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save settings: {e}")
+                self._pending_update = settings
+                if not self._update_scheduled:
+                    self._update_scheduled = True
+                    self.root.after_idle(self._flush_listener_update)
+            
+            # Write on the I/O thread so a slow disk doesn't freeze the window
+            future = self._io_pool.submit(self.write_settings, settings, settings_path)
+            # Polled from the main thread, Tk must not be called from the worker
+            self.root.after(50, self._poll_save, future, settings_path)
+            
+        except tk.TclError as e:
+            # A Tk variable holds text that doesn't fit its type, e.g. a bad delay
+            messagebox.showerror("Error", f"Invalid setting value: {e}")
             self.log_message(f"❌ Failed to save settings: {e}")
     
+    def _flush_listener_update(self):
+        """Push the most recent saved settings to the listener"""
+        settings = self._pending_update
+        self._pending_update = None
+        self._update_scheduled = False
+        
+        if self.listener and settings is not None:
+            self.listener.update_settings(settings)
+    
+    def _poll_save(self, future, settings_path):
+        """Wait for a background settings save without blocking the window"""
+        if future.done():
+            self._on_save_done(future, settings_path)
+        else:
+            self.root.after(50, self._poll_save, future, settings_path)
+    
+    def _on_save_done(self, future, settings_path):
+        """Report the result of a background settings save in the main thread"""
+        error = future.exception()
+        if isinstance(error, OSError):
+            messagebox.showerror("Error", f"Failed to write settings file: {error}")
+            self.log_message(f"❌ Failed to write settings file: {error}")
+            return
+        if isinstance(error, (TypeError, ValueError)):
+            messagebox.showerror("Error", f"Failed to serialize settings: {error}")
+            self.log_message(f"❌ Failed to serialize settings: {error}")
+            return
+        if error:
+            raise error
+        
+        messagebox.showinfo("Success", f"Settings saved successfully!\n\nLocation: {settings_path}")
+        if future.result():
+            self.log_message(f"Settings saved to: {settings_path}")
+        else:
+            self.log_message("Settings unchanged, nothing to write")
+    
     def load_settings(self):
         """Load settings from file"""
         settings_path = self.get_settings_path()
         
         try:
-            with open(settings_path, 'r') as f:
-                settings = json.load(f)
+            with open(settings_path, 'rb') as f:
+                settings = _loads(f.read())
+                self._persisted_blob = _dumps(settings)
                 self.log_message(f"Settings loaded from: {settings_path}")
                 return settings
         except FileNotFoundError:
             # No settings file exists yet - use defaults
             self.log_message(f"No settings file found, using defaults. Will create: {settings_path}")
-            return {
-                'youtube_api_key': '',
-                'preferred_quality': '1080p',
-                'fullscreen': True,
-                'muted': True,
-                'always_on_top': False,
-                'force_best_quality': True,
-                'sync_video_to_song': True,
-                'auto_quit_on_menu': True,
-                'video_start_delay': 0.0,
-                'debug_events': True,
-                'database_path': ''
-            }
+            return dict(_DEFAULT_SETTINGS)
         except Exception as e:
             self.log_message(f"❌ Error loading settings: {e}")
             return {}
@@ -1697,17 +2268,19 @@ class RB3VideoPlayerGUI:
         if self.is_running:
             self.stop_listener()
         
+        # Don't wait on background work here; write_settings holds the settings
+        # lock, so the final save below still lands after any save in flight
+        self._io_pool.shutdown(wait=False)
+        
         # Save settings
         try:
             settings = self.get_current_settings()
             settings_path = self.get_settings_path()
             
-            with open(settings_path, 'w') as f:
-                json.dump(settings, f, indent=2)
-            
-            self.log_message(f"Settings saved on exit to: {settings_path}")
-        except Exception as e:
-            self.log_message(f"❌ Failed to save settings on exit: {e}")
+            if self.write_settings(settings, settings_path):
+                self.log_message(f"Settings saved on exit to: {settings_path}")
+        except (OSError, tk.TclError) as e:
+            self.log_message(f"❌ Failed to persist settings on exit: {e}")
         
         self.root.destroy()
     